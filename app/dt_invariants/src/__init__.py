@@ -2,11 +2,11 @@ from .categories.abelian_category import AbelianCategory  # noqa: F401
 from .categories.slicing import Slicing  # noqa: F401
 from .examples.quiver import Quiver  # noqa: F401
 from .linear_algebra.central_charge import CentralCharge  # noqa: F401
-from .linear_algebra.cone import Cone  # noqa: F401
+from .linear_algebra.cone import Cone, NegatedCone  # noqa: F401
 from .linear_algebra.dimension_vector import DimensionVector  # noqa: F401
 from .linear_algebra.phase import Phase  # noqa: F401
 from .linear_algebra.pairing import Pairing  # noqa: F401
-from .linear_algebra.standard_cone import StandardCone  # noqa: F401
+from .linear_algebra.standard_cone import StandardCone, standard_cone  # noqa: F401
 from .motives.dt_invariants import DTInvariants  # noqa: F401
 from .motives.exp import Exp  # noqa: F401
 from .motives.gl import GL  # noqa: F401
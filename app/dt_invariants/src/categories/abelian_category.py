@@ -1,14 +1,16 @@
 from __future__ import annotations
 
-from typing import Optional, cast
+from functools import cached_property
+from typing import Optional
 
 from ..linear_algebra.pairing import Pairing
 from ..motives.motivic_series import MotivicSeries
 from ..motives.symbols import R
+from ..motives.types import Name
 
 
 class AbelianCategory:
-    def __init__(self, motive_of_objects: MotivicSeries, euler_pairing: Pairing, name: Optional[str] = None) -> None:
+    def __init__(self, motive_of_objects: MotivicSeries, euler_pairing: Pairing, name: Optional[Name] = None) -> None:
         assert (
             euler_pairing.rank == motive_of_objects.rank
         ), "The motivic series and the euler pairing must have the same rank"
@@ -16,27 +18,43 @@ class AbelianCategory:
         self.rank = euler_pairing.rank
         self.euler_pairing = euler_pairing
         self.motive_of_objects = motive_of_objects
-        self.name: str = name if name else repr(self)
-        self._normalized_motive_of_objects: Optional[MotivicSeries] = None
+        self._name = name
+        self._shift_cache: dict[int, AbelianCategory] = {}
+        # the category this one is a shift of, and by how much
+        self._unshifted: AbelianCategory = self
+        self._shift: int = 0
+
+    @cached_property
+    def name(self) -> str:
+        if callable(self._name):
+            return self._name()
+        return self._name if self._name else repr(self)
 
     def __getitem__(self, shift: int) -> AbelianCategory:
-        return AbelianCategory(
-            motive_of_objects=self.motive_of_objects[shift],
-            euler_pairing=self.euler_pairing,
-            name=f"{self.name}[{shift}]",
-        )
-
-    @property
+        if shift == 0:
+            return self
+        if self._unshifted is not self:
+            # compose shifts instead of wrapping shifted categories repeatedly
+            return self._unshifted[self._shift + shift]
+        try:
+            return self._shift_cache[shift]
+        except KeyError:
+            result = AbelianCategory(
+                motive_of_objects=self.motive_of_objects[shift],
+                euler_pairing=self.euler_pairing,
+                name=lambda: f"{self.name}[{shift}]",
+            )
+            result._unshifted, result._shift = self, shift
+            self._shift_cache[shift] = result
+            return result
+
+    @cached_property
     def normalized_motive_of_objects(self) -> MotivicSeries:
-        if self._normalized_motive_of_objects:
-            return self._normalized_motive_of_objects
-        else:
-            self.set_normalized_motive_of_objects()
-            return cast(MotivicSeries, self._normalized_motive_of_objects)
-
-    def set_normalized_motive_of_objects(self) -> None:
-        self._normalized_motive_of_objects = MotivicSeries(
+        return MotivicSeries(
             cone=self.motive_of_objects.cone,
-            at_dv=lambda d: R ** self.euler_pairing(d, d) * self.motive_of_objects(d),
-            name=f"{self.motive_of_objects.name}_vir",
+            at_dv=lambda d: R ** self.euler_pairing.quadratic(d) * self.motive_of_objects(d),
+            at_dvs=lambda ds: [
+                R ** self.euler_pairing.quadratic(d) * m for d, m in zip(ds, self.motive_of_objects.at_many(ds))
+            ],
+            name=lambda: f"{self.motive_of_objects.name}_vir",
         )
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import Optional, cast
 
 from ..linear_algebra.phase import Phase
@@ -16,9 +17,12 @@ class Slicing:
         self.rank = euler_pairing.rank
         self.euler_pairing = euler_pairing
         self.motive_of_objects = motive_of_objects
-        self.name: str = name if name else repr(self)
+        self._name = name
         self._cache: dict[Phase, AbelianCategory] = {}
-        self._dt_invariants: Optional[SlicedMotive] = None
+
+    @cached_property
+    def name(self) -> str:
+        return self._name if self._name else repr(self)
 
     def __call__(self, phi: Phase) -> AbelianCategory:
         result = self._cache.get(phi)
@@ -26,18 +30,11 @@ class Slicing:
             result = AbelianCategory(
                 motive_of_objects=cast(MotivicSeries, self.motive_of_objects(phi)),
                 euler_pairing=self.euler_pairing,
-                name=f"{self.name}({float(phi)})",
+                name=lambda: f"{self.name}({float(phi)})",
             )
             self._cache[phi] = result
         return result
 
-    @property
+    @cached_property
     def dt_invariants(self) -> SlicedMotive:
-        if self._dt_invariants:
-            return self._dt_invariants
-        else:
-            self.set_dt_invariants()
-            return cast(SlicedMotive, self._dt_invariants)
-
-    def set_dt_invariants(self) -> None:
-        self._dt_invariants = DTInvariants(slicing=self)
+        return DTInvariants(slicing=self)
@@ -1,8 +1,9 @@
-from typing import Optional, cast
+from functools import cached_property
+from typing import Optional
 
 from ..categories.abelian_category import AbelianCategory
 from ..linear_algebra.pairing import Pairing
-from ..linear_algebra.standard_cone import StandardCone
+from ..linear_algebra.standard_cone import standard_cone
 from ..motives.gl import GL
 from ..motives.motivic_series import MotivicSeries
 from ..motives.symbols import L
@@ -13,37 +14,34 @@ class Quiver:
         self.num_vertices = num_vertices
         self.vertices: range = range(num_vertices)
         self.arrow_matrix = arrow_matrix
-        self.name = name if name else repr(self)
-        self._reps: Optional[AbelianCategory] = None
+        self._name = name
 
         self.hom: Pairing = Pairing(rank=num_vertices)  # the standard scalar product
         self.ext: Pairing = Pairing(rank=num_vertices, coeff_matrix=arrow_matrix)
 
         # Euler pairing
-        coeff_matrix: dict[tuple[int, int], int] = {
-            (source, target): -num_arrows for (source, target), num_arrows in arrow_matrix.items()
-        }
-        coeff_matrix.update({(i, i): 1 + coeff_matrix.get((i, i), 0) for i in self.vertices})
-        self.euler_pairing: Pairing = Pairing(
-            rank=num_vertices, coeff_matrix={k: v for k, v in coeff_matrix.items() if v != 0}
-        )
-
-    @property
+        coeff_matrix: dict[tuple[int, int], int] = {(i, i): 1 for i in self.vertices}
+        for arrow, num_arrows in arrow_matrix.items():
+            coeff = coeff_matrix.get(arrow, 0) - num_arrows
+            if coeff:
+                coeff_matrix[arrow] = coeff
+            else:
+                coeff_matrix.pop(arrow, None)
+        self.euler_pairing: Pairing = Pairing(rank=num_vertices, coeff_matrix=coeff_matrix)
+
+    @cached_property
+    def name(self) -> str:
+        return self._name if self._name else repr(self)
+
+    @cached_property
     def reps(self) -> AbelianCategory:
-        if self._reps:
-            return self._reps
-        else:
-            self.set_quiver_reps()
-            return cast(AbelianCategory, self._reps)
-
-    def set_quiver_reps(self) -> None:
         motive_of_objects: MotivicSeries = MotivicSeries(
-            cone=StandardCone(rank=self.num_vertices),
+            cone=standard_cone(self.num_vertices),
             at_dv=lambda d: L ** self.ext(d, d) / GL(d),
             name=f"Generating Series({self.name})",
         )
 
-        self._reps = AbelianCategory(
+        return AbelianCategory(
             motive_of_objects=motive_of_objects, euler_pairing=self.euler_pairing, name=f"{self.name}-Reps"
         )
 
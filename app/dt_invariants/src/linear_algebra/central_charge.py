@@ -1,8 +1,13 @@
+from collections import OrderedDict
+from operator import mul
 from typing import Optional
 
 from .dimension_vector import DimensionVector
 from .phase import Phase
 
+# values and phases are cached for at most this many dimension vectors, the least recently used are dropped
+MAX_CACHED_VECTORS = 4096
+
 
 class CentralCharge:
     def __init__(self, real: Optional[list[int]] = None, imag: Optional[list[int]] = None) -> None:
@@ -12,8 +17,10 @@ class CentralCharge:
             self.rank = len(imag)
         else:
             raise ValueError("Real or imaginary part must be provided.")
-        self.real: list[int] = real if real else self.rank * [0]
-        self.imag: list[int] = imag if imag else self.rank * [1]
+        self.real: tuple[int, ...] = tuple(real) if real else self.rank * (0,)
+        self.imag: tuple[int, ...] = tuple(imag) if imag else self.rank * (1,)
+        self._cache: OrderedDict[DimensionVector, tuple[int, int]] = OrderedDict()
+        self._phase_cache: OrderedDict[DimensionVector, Phase] = OrderedDict()
 
         self._validate()
 
@@ -24,21 +31,36 @@ class CentralCharge:
         assert all(isinstance(b, int) for b in self.imag), "the imaginary part must consist of integers"
 
     def _real(self, d: DimensionVector) -> int:
-        return sum(a * x for a, x in zip(self.real, d))
+        return sum(map(mul, self.real, d))
 
     def _imag(self, d: DimensionVector) -> int:
-        return sum(a * x for a, x in zip(self.imag, d))
+        return sum(map(mul, self.imag, d))
 
     def __call__(self, d: DimensionVector) -> tuple[int, int]:
-        assert len(d) == self.rank, f"dimension vector must have {self.rank} components"
-        return (self._real(d), self._imag(d))
+        try:
+            self._cache.move_to_end(d)
+            return self._cache[d]
+        except KeyError:
+            assert len(d) == self.rank, f"dimension vector must have {self.rank} components"
+            self._cache[d] = (self._real(d), self._imag(d))
+            if len(self._cache) > MAX_CACHED_VECTORS:
+                self._cache.popitem(last=False)
+            return self._cache[d]
 
     def slope(self, d: DimensionVector) -> float:
-        assert len(d) == self.rank, f"dimension vector must have {self.rank} components"
-        return -self._real(d) / self._imag(d)
+        real, imag = self(d)
+        return -real / imag
 
     def phase(self, d: DimensionVector) -> Phase:
-        if self._imag(d) > 0 or self._imag(d) == 0 and self._real(d) < 0:
-            return Phase(real=self._real(d), imag=self._imag(d), branch=0)
-        else:
-            return Phase(real=self._real(d), imag=self._imag(d), branch=1)
+        try:
+            self._phase_cache.move_to_end(d)
+            return self._phase_cache[d]
+        except KeyError:
+            real, imag = self(d)
+            if imag > 0 or imag == 0 and real < 0:
+                self._phase_cache[d] = Phase(real=real, imag=imag, branch=0)
+            else:
+                self._phase_cache[d] = Phase(real=real, imag=imag, branch=1)
+            if len(self._phase_cache) > MAX_CACHED_VECTORS:
+                self._phase_cache.popitem(last=False)
+            return self._phase_cache[d]
@@ -1,9 +1,37 @@
 from __future__ import annotations
 
-from typing import Callable, Generator, Optional
+from collections import OrderedDict
+from functools import cached_property
+from itertools import chain, islice
+from typing import Callable, Generator, Iterable, Iterator, Optional, TypeVar
 
 from .dimension_vector import DimensionVector
 
+# a partition as a pair (parts, multiplicities) of equally long tuples
+Partition = tuple[tuple[DimensionVector, ...], tuple[int, ...]]
+
+# enumerations longer than this are streamed on every call instead of being cached
+MAX_CACHED_ENUMERATION = 10_000
+# each cone caches the enumerations of at most this many dimension vectors, the least recently used are dropped
+MAX_CACHED_VECTORS = 4096
+
+T = TypeVar("T")
+
+
+def _cache_if_short(
+    cache: OrderedDict[DimensionVector, tuple[T, ...]], d: DimensionVector, items: Iterator[T]
+) -> Iterator[T]:
+    """Caches the enumeration 'items' under 'd' if it is short enough, otherwise streams it after
+    buffering only its first MAX_CACHED_ENUMERATION + 1 elements
+    """
+    head = tuple(islice(items, MAX_CACHED_ENUMERATION + 1))
+    if len(head) <= MAX_CACHED_ENUMERATION:
+        cache[d] = head
+        if len(cache) > MAX_CACHED_VECTORS:
+            cache.popitem(last=False)
+        return iter(head)
+    return chain(head, items)
+
 
 class Cone:
     def __init__(
@@ -17,45 +45,88 @@ class Cone:
         self.rank = rank
         self.is_contained = is_contained
         self.pred_of = pred_of
-        self.name = name if name else repr(self)
+        self._name = name
+        self._summands_cache: OrderedDict[DimensionVector, tuple[DimensionVector, ...]] = OrderedDict()
+        self._partitions_cache: OrderedDict[DimensionVector, tuple[Partition, ...]] = OrderedDict()
+
+    @cached_property
+    def name(self) -> str:
+        return self._name if self._name else repr(self)
 
     def contains(self, d: DimensionVector) -> bool:
         return self.is_contained(d)
 
-    def summands(self, d: DimensionVector) -> Generator[DimensionVector, None, None]:
-        e = d.copy()
+    def summands(self, d: DimensionVector) -> Iterator[DimensionVector]:
+        try:
+            self._summands_cache.move_to_end(d)
+            return iter(self._summands_cache[d])
+        except KeyError:
+            return _cache_if_short(self._summands_cache, d, self._summands(d))
+
+    def _summands(self, d: DimensionVector) -> Generator[DimensionVector, None, None]:
+        # dimension vectors are immutable, so 'd' itself can be handed out without copying
+        pred_of = self.pred_of
+        e = d
         yield e
         while not e.is_zero():
-            e = self.pred_of(e, d)
+            e = pred_of(e, d)
             yield e
 
-    def partitions(
+    def partitions(self, d: DimensionVector, below: Optional[DimensionVector] = None) -> Iterator[Partition]:
+        if below is not None:
+            return self._partitions(d, below)
+        try:
+            self._partitions_cache.move_to_end(d)
+            return iter(self._partitions_cache[d])
+        except KeyError:
+            return _cache_if_short(self._partitions_cache, d, self._partitions(d))
+
+    def partitions_batch(self, ds: Iterable[DimensionVector]) -> list[list[Partition]]:
+        """Returns the partitions of several dimension vectors, sharing the partition cache of the cone"""
+        return [list(self.partitions(d)) for d in ds]
+
+    def _partitions(
         self, d: DimensionVector, below: Optional[DimensionVector] = None
-    ) -> Generator[dict[DimensionVector, int], None, None]:
+    ) -> Generator[Partition, None, None]:
+        pred_of = self.pred_of
         if below is None:
             below = 2 * d
         if below.is_zero():
             return
-        e = self.pred_of(below, d)
+        e = pred_of(below, d)
         if e.is_zero():
             return
-        q, r = divmod(d, e)
-        i = 0
-        while i < 10_000:
+        # Each level [d, e, q, r] of the stack splits off q copies of the part e from d, leaving
+        # the remainder r, which the next level partitions into parts strictly below e.
+        stack: list[list] = [[d, e, *divmod(d, e)]]
+        while stack:
+            _, e, _, r = stack[-1]
             if r.is_zero():
-                yield {e: q}
-            else:
-                for part in self.partitions(r, below=e):
-                    yield {e: q, **part}
-            if q > 1:
-                q -= 1
-                r += e
+                yield tuple(level[1] for level in stack), tuple(level[2] for level in stack)
             else:
-                e = self.pred_of(e, d)
+                f = pred_of(e, r)
+                if not f.is_zero():
+                    stack.append([r, f, *divmod(r, f)])
+                    continue
+            # advance to the next partition, dropping exhausted levels
+            while stack:
+                level = stack[-1]
+                d, e, q, r = level
+                if q > 1:
+                    level[2:] = q - 1, r + e
+                    break
+                e = pred_of(e, d)
                 if e.is_zero():
-                    return
-                q, r = divmod(d, e)
-            i += 1
+                    stack.pop()
+                else:
+                    level[1:] = e, *divmod(d, e)
+                    break
+
+    def partitions_as_dict(
+        self, d: DimensionVector, below: Optional[DimensionVector] = None
+    ) -> Generator[dict[DimensionVector, int], None, None]:
+        for parts, mults in self.partitions(d, below=below):
+            yield dict(zip(parts, mults))
 
     def divmod(self, d: DimensionVector, e: DimensionVector):
         q = 0
@@ -70,9 +141,25 @@ class Cone:
         if shift % 2 == 0:
             return Cone(rank=self.rank, is_contained=self.is_contained, pred_of=self.pred_of, name=name)
         else:
-            return Cone(
-                rank=self.rank,
-                is_contained=lambda d: self.contains(-d),
-                pred_of=lambda d, upper_bound: -self.pred_of(-d, -upper_bound),
-                name=name,
-            )
+            return NegatedCone(self, name=name)
+
+
+class NegatedCone(Cone):
+    """The cone -C of all vectors -d with d in C, i.e. the odd shifts of C"""
+
+    def __init__(self, cone: Cone, name: Optional[str] = None) -> None:
+        self.cone = cone
+        super().__init__(rank=cone.rank, is_contained=self._is_contained, pred_of=self._pred_of, name=name)
+
+    def _is_contained(self, d: DimensionVector) -> bool:
+        return self.cone.is_contained(-d)
+
+    def _pred_of(self, d: DimensionVector, upper_bound: DimensionVector) -> DimensionVector:
+        return -self.cone.pred_of(-d, -upper_bound)
+
+    def __getitem__(self, shift: int) -> Cone:
+        if shift % 2 == 0:
+            return super().__getitem__(shift)
+        # negating twice gives back the original cone
+        cone = self.cone
+        return Cone(rank=cone.rank, is_contained=cone.is_contained, pred_of=cone.pred_of, name=f"{self.name}[{shift}]")
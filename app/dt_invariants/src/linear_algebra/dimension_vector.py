@@ -1,9 +1,13 @@
 from __future__ import annotations
 
 from collections.abc import Iterable
+from functools import lru_cache
+from operator import add, ge, le, neg, sub
 
 
 class DimensionVector(tuple):
+    __slots__ = ()
+
     def __new__(cls, *args) -> DimensionVector:
         if isinstance(args[0], Iterable):
             vector = super(DimensionVector, cls).__new__(cls, args[0])
@@ -11,12 +15,17 @@ class DimensionVector(tuple):
             vector = super(DimensionVector, cls).__new__(cls, args)
         return vector
 
+    @classmethod
+    def _from_iterable(cls, coords: Iterable[int]) -> DimensionVector:
+        """internal constructor which skips the inspection of the arguments done by '__new__'"""
+        return tuple.__new__(cls, coords)
+
     @classmethod
     def zero(cls, num_vertices: int) -> DimensionVector:
-        return DimensionVector(0 for _ in range(num_vertices))
+        return interned(num_vertices * (0,))
 
     def __add__(self, other: DimensionVector) -> DimensionVector:  # type: ignore[override]
-        return DimensionVector(map(lambda x: x[0] + x[1], zip(self, other)))
+        return DimensionVector._from_iterable(map(add, self, other))
 
     def __iadd__(self, other: DimensionVector) -> DimensionVector:  # type: ignore[override]
         # for idx, x in enumerate(other):
@@ -24,44 +33,45 @@ class DimensionVector(tuple):
         return self + other
 
     def __sub__(self, other: DimensionVector) -> DimensionVector:
-        return DimensionVector(map(lambda x: x[0] - x[1], zip(self, other)))
+        return DimensionVector._from_iterable(map(sub, self, other))
 
     def __neg__(self) -> DimensionVector:
-        return DimensionVector(-x for x in self)
+        return DimensionVector._from_iterable(map(neg, self))
 
     def __mul__(self, factor: int) -> DimensionVector:  # type: ignore[override]
-        return DimensionVector(map(lambda x: factor * x, self))
+        return DimensionVector._from_iterable([factor * x for x in self])
 
     def __rmul__(self, factor: int) -> DimensionVector:  # type: ignore[override]
         return self * factor
 
     def __truediv__(self, divisor: int) -> DimensionVector:
-        return DimensionVector(map(lambda x: x // divisor, self))
+        return DimensionVector._from_iterable([x // divisor for x in self])
 
     def __floordiv__(self, other: DimensionVector) -> int:
-        assert not other.is_zero(), "Cannot divide by zero vector!"
-        eligible_pairs = filter(lambda x: x[1] != 0, zip(self, other))
-        quotients = map(lambda x: x[0] // x[1], eligible_pairs)
-        return min(quotients)
+        try:
+            return min(x // y for x, y in zip(self, other) if y)
+        except ValueError:
+            # only raised if there is no nonzero coordinate to divide by
+            raise ZeroDivisionError("Cannot divide by zero vector!") from None
 
     def __mod__(self, other: DimensionVector) -> DimensionVector:
-        return self - other * (self // other)
+        return divmod(self, other)[1]
 
     def __divmod__(self, other: DimensionVector) -> tuple[int, DimensionVector]:
         """
         returns the pair (self // other, self % other)
         """
         quotient = self // other
-        return quotient, self - quotient * other
+        return quotient, DimensionVector._from_iterable([x - quotient * y for x, y in zip(self, other)])
 
     def __repr__(self) -> str:
-        return f"d({','.join(map(lambda x: str(x), self))})"
+        return f"d({','.join(map(str, self))})"
 
     def copy(self) -> DimensionVector:
-        return DimensionVector((x for x in self))
+        return DimensionVector._from_iterable(self)
 
     def is_zero(self) -> bool:
-        return all(map(lambda x: x == 0, self))
+        return not any(self)
 
     def __lshift__(self, other: DimensionVector) -> bool:
         """
@@ -70,7 +80,7 @@ class DimensionVector(tuple):
 
         Note: d << e implies d < e
         """
-        return all(map(lambda x: x[0] <= x[1], zip(self, other))) and self != other
+        return all(map(le, self, other)) and self != other
 
     def __rshift__(self, other: DimensionVector) -> bool:
         """
@@ -79,4 +89,10 @@ class DimensionVector(tuple):
 
         Note: d >> e implies d > e
         """
-        return all(map(lambda x: x[0] >= x[1], zip(self, other))) and self != other
+        return all(map(ge, self, other)) and self != other
+
+
+@lru_cache(maxsize=65536)
+def interned(coords: tuple[int, ...]) -> DimensionVector:
+    """Returns a shared DimensionVector with the given coordinates"""
+    return DimensionVector._from_iterable(coords)
@@ -1,4 +1,5 @@
-from typing import Optional
+from operator import mul
+from typing import Optional, Sequence
 
 from .dimension_vector import DimensionVector
 
@@ -12,7 +13,69 @@ class Pairing:
         else:
             self.coeff_matrix = coeff_matrix
 
+        # dense rows of the coefficient matrix, built once for fast evaluation
+        rows: list[list[int]] = [rank * [0] for _ in range(rank)]
+        for (i, j), coeff in self.coeff_matrix.items():
+            rows[i][j] += coeff
+        self._rows: tuple[tuple[int, ...], ...] = tuple(tuple(row) for row in rows)
+        # the nonzero entries (j, coeff) of every row, so that evaluation skips vanishing terms
+        self._sparse_rows: tuple[tuple[tuple[int, int], ...], ...] = tuple(
+            tuple((j, coeff) for j, coeff in enumerate(row) if coeff) for row in self._rows
+        )
+        # the quadratic form (d, d) only needs the upper triangle, with the lower triangle folded onto it
+        upper: list[tuple[int, int, int]] = []
+        for i in range(rank):
+            for j in range(i, rank):
+                coeff = rows[i][j] + rows[j][i] if i < j else rows[i][i]
+                if coeff:
+                    upper.append((i, j, coeff))
+        self._upper: tuple[tuple[int, int, int], ...] = tuple(upper)
+        # (d, e) and (e, d) share a cache entry if the matrix is symmetric
+        self._symmetric: bool = all(rows[i][j] == rows[j][i] for i in range(rank) for j in range(i))
+        self._cache: dict[tuple[DimensionVector, DimensionVector], int] = {}
+
     def __call__(self, d: DimensionVector, e: DimensionVector) -> int:
+        key = (e, d) if self._symmetric and e < d else (d, e)
+        try:
+            return self._cache[key]
+        except KeyError:
+            self._cache[key] = self._evaluate(d, e)
+            return self._cache[key]
+
+    def _evaluate(self, d: DimensionVector, e: DimensionVector) -> int:
         assert len(d) == self.rank, f"DimensionVector must have length {self.rank}"
         assert len(e) == self.rank, f"DimensionVector must have length {self.rank}"
-        return sum(d[i] * e[j] * coeff for (i, j), coeff in self.coeff_matrix.items())
+        result = 0
+        for x, row in zip(d, self._sparse_rows):
+            if x:
+                for j, coeff in row:
+                    y = e[j]
+                    if y:
+                        result += x * y * coeff
+        return result
+
+    def quadratic(self, d: DimensionVector) -> int:
+        """Returns the pairing (d, d), visiting every pair of coordinates only once"""
+        try:
+            return self._cache[(d, d)]
+        except KeyError:
+            assert len(d) == self.rank, f"DimensionVector must have length {self.rank}"
+            self._cache[(d, d)] = sum(coeff * d[i] * d[j] for i, j, coeff in self._upper)
+            return self._cache[(d, d)]
+
+    def batch(self, ds: Sequence[DimensionVector], es: Sequence[DimensionVector]) -> list[list[int]]:
+        """Returns the matrix of all pairings (d, e) with d in ds and e in es
+
+        Args:
+            ds (Sequence[DimensionVector]): the dimension vectors indexing the rows
+            es (Sequence[DimensionVector]): the dimension vectors indexing the columns
+
+        Returns:
+            list[list[int]]: the matrix with entry (ds[i], es[j]) in row i and column j
+        """
+        images = [[sum(map(mul, row, e)) for row in self._rows] for e in es]  # M * e, computed once per e
+        return [[sum(map(mul, d, image)) for image in images] for d in ds]
+
+    def gram(self, vs: Sequence[DimensionVector]) -> list[list[int]]:
+        """Returns the Gram matrix of the pairing on vs, i.e. the matrix of all pairings (v, w) with v and w in vs"""
+        return self.batch(vs, vs)
@@ -1,8 +1,8 @@
 from __future__ import annotations
 
-from cmath import phase
 from dataclasses import dataclass
-from math import pi
+from functools import cached_property
+from math import atan2, gcd, pi
 
 
 @dataclass(init=True, frozen=True)
@@ -24,24 +24,68 @@ class Phase:
             assert self.imag < 0 or self.real > 0
         else:
             assert self.imag > 0 or self.real < 0
+        # store the primitive vector on the ray, positive multiples describe the same phase
+        g = gcd(self.real, self.imag)
+        if g > 1:
+            object.__setattr__(self, "real", self.real // g)
+            object.__setattr__(self, "imag", self.imag // g)
 
-    def slope(self) -> float:
+    # Phases are immutable, so derived values are computed once per instance. 'cached_property'
+    # stores them in the instance dict directly, which a frozen dataclass allows.
+    @cached_property
+    def _slope(self) -> float:
         if self.imag:
             return -self.real / self.imag
         else:
             return float("inf")
 
-    def __eq__(self, other: Phase) -> bool:  # type: ignore[override]
+    @cached_property
+    def _float(self) -> float:
+        sign = -1 if self.branch & 1 else 1
+        real, imag = sign * self.real, sign * self.imag
+        # the axes are hit exactly, everything else is the argument of real + i * imag
+        if not imag:
+            return self.branch + (1.0 if real < 0 else 0.0)
+        if not real:
+            return self.branch + (0.5 if imag > 0 else -0.5)
+        return self.branch + atan2(imag, real) / pi
+
+    @cached_property
+    def _int(self) -> int:
+        return self.branch if self.imag != 0 else self.branch + 1
+
+    def slope(self) -> float:
+        return self._slope
+
+    def __eq__(self, other: object) -> bool:
         "'self' and 'other' have the same branch and slope"
+        if not isinstance(other, Phase):
+            return NotImplemented
         return self.branch == other.branch and self.real * other.imag == other.real * self.imag
 
+    def __hash__(self) -> int:
+        "consistent with '__eq__': phases on the same ray and branch share the hash"
+        return self._hash
+
+    @cached_property
+    def _hash(self) -> int:
+        # 'real' and 'imag' are already primitive, only the orientation of the ray is normalized
+        real, imag = self.real, self.imag
+        if imag < 0 or imag == 0 and real < 0:
+            real, imag = -real, -imag
+        # the tag keeps the hash apart from the one of a tuple (or DimensionVector) with the same entries
+        return hash((Phase, self.branch, real, imag))
+
     def __lt__(self, other: Phase) -> bool:
-        if self.branch < other.branch:
-            return True
-        elif self.branch > other.branch:
+        if self.branch != other.branch:
+            return self.branch < other.branch
+        # compare the slopes -real / imag exactly, a vanishing imaginary part means slope infinity
+        if not self.imag:
             return False
-        else:
-            return self.slope() < other.slope()
+        if not other.imag:
+            return True
+        lhs, rhs = other.real * self.imag, self.real * other.imag
+        return lhs < rhs if (self.imag > 0) == (other.imag > 0) else lhs > rhs
 
     def covers(self, z: tuple[int, int]) -> bool:
         """Checks if the complex number z[0] + i * z[1] has phase 'self' modulo 2
@@ -59,10 +103,10 @@ class Phase:
             return True
 
     def __float__(self):
-        return self.branch + phase((-1) ** self.branch * complex(self.real, self.imag)) / pi
+        return self._float
 
     def __int__(self):
-        return self.branch if self.imag != 0 else self.branch + 1
+        return self._int
 
     def __getitem__(self, shift: int) -> Phase:
         if shift % 2 == 0:
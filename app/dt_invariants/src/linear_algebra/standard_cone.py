@@ -1,18 +1,18 @@
-from typing import Optional
+from functools import lru_cache
+from itertools import product
+from typing import Generator, Optional
 
 from .cone import Cone
-from .dimension_vector import DimensionVector
+from .dimension_vector import DimensionVector, interned
 
 
 class StandardCone(Cone):
     def __init__(self, rank: int, name: Optional[str] = None) -> None:
         def is_contained(d: DimensionVector) -> bool:
-            if len(d) != rank:
-                return False
-            if min(d) < 0:
-                return False
-            return True
+            return len(d) == rank and min(d) >= 0
 
+        # the same (d, upper_bound) pairs recur throughout summand and partition enumeration
+        @lru_cache(maxsize=100_000)
         def pred_of(d: DimensionVector, upper_bound: DimensionVector) -> DimensionVector:
             """
             returns the maximum of the finite set { e | e < d and e <<= upper_bound } with respect to <
@@ -22,15 +22,30 @@ class StandardCone(Cone):
             for idx, x in enumerate(d):
                 if upper_bound[idx] < x:
                     predecessor[idx:] = upper_bound[idx:]
-                    return DimensionVector(*predecessor)
+                    return interned(tuple(predecessor))
             # at this point we have returned or self <<= upper_bound
             idx = -1
             while True:
                 if d[idx] > 0:
                     predecessor[idx] -= 1
-                    return DimensionVector(*predecessor)
+                    return interned(tuple(predecessor))
                 else:
                     predecessor[idx] = upper_bound[idx]
                 idx -= 1
 
         super().__init__(rank=rank, is_contained=is_contained, pred_of=pred_of, name=name)
+
+    def _summands(self, d: DimensionVector) -> Generator[DimensionVector, None, None]:
+        if not self.contains(d):
+            yield from super()._summands(d)
+            return
+        # the summands of d fill the box 0 <= e <= d, which 'product' runs through in descending lexicographic
+        # order, exactly the order of repeated 'pred_of' steps
+        yield from map(DimensionVector._from_iterable, product(*(range(x, -1, -1) for x in d)))
+
+
+# each cone keeps its enumeration caches and predecessor cache alive, so only the most recently used ranks are kept
+@lru_cache(maxsize=8)
+def standard_cone(rank: int) -> StandardCone:
+    """Returns the unnamed standard cone of the given rank, shared between all callers"""
+    return StandardCone(rank=rank)
@@ -0,0 +1,39 @@
+from functools import lru_cache
+from typing import Callable, Generator, Iterable
+
+from sympy import Mul, S
+from sympy import divisors as _divisors
+
+from ..linear_algebra.cone import Partition
+from ..linear_algebra.dimension_vector import DimensionVector
+from .symbols import R
+from .types import FractionalMotive, Motive
+
+
+@lru_cache(maxsize=None)
+def divisors(n: int) -> tuple[int, ...]:
+    """Returns the positive divisors of n in ascending order"""
+    return tuple(_divisors(n))
+
+
+@lru_cache(maxsize=None)
+def adams_substitution(k: int) -> tuple[Motive, Motive]:
+    """Returns the pair (old, new) for 'subs' which maps R to -(-R)**k"""
+    return R, -((-R) ** k)
+
+
+def adams_operation(motive: FractionalMotive, k: int) -> FractionalMotive:
+    """Substitutes -(-R)**k for R in the given motive, which does nothing for k = 1"""
+    return motive.subs(*adams_substitution(k)) if k > 1 else motive
+
+
+def partition_products(
+    term: Callable[[DimensionVector, int], FractionalMotive], partitions: Iterable[Partition]
+) -> Generator[FractionalMotive, None, None]:
+    """Yields the products of term(e, m) over the parts e with multiplicities m of every partition,
+    skipping partitions with a vanishing term
+    """
+    for parts, mults in partitions:
+        terms = [*map(term, parts, mults)]
+        if S.Zero not in terms:
+            yield Mul(*terms)
@@ -35,10 +35,14 @@ class DTInvariants(SlicedMotive):
         except KeyError:
             log: MotivicSeries = Log(self.slicing(phi).normalized_motive_of_objects)
             self._log_cache[phi] = log
-            return MotivicSeries(cone=log.cone, at_dv=lambda d: (L - 1) / R * log(d), name=f"{(L-1)/R} * {log.name}")
+            return MotivicSeries(
+                cone=log.cone, at_dv=lambda d: (L - 1) / R * log(d), name=lambda: f"{(L-1)/R} * {log.name}"
+            )
 
     def at(self, d: DimensionVector) -> FractionalMotive:
-        return R ** (-self.vdim(d)) * sympy.expand(sympy.factor(R ** self.vdim(d) * super().at(d)))
+        vdim = self.vdim(d)
+        # cancelling common factors only needs polynomial gcds, not a full factorization
+        return R ** (-vdim) * sympy.expand(sympy.cancel(R**vdim * super().at(d)))
 
     def vdim(self, d: DimensionVector) -> int:
-        return 1 - self.euler_pairing(d, d)
+        return 1 - self.euler_pairing.quadratic(d)
@@ -1,18 +1,19 @@
-from math import factorial, gcd, prod
+from math import factorial, gcd
 
-from sympy import Integer, Rational, divisors, factor
+from sympy import Add, Integer, Rational, factor
 
 from ..linear_algebra.dimension_vector import DimensionVector
+from .adams import adams_operation, divisors, partition_products
 from .motivic_series import MotivicSeries
-from .symbols import R
 from .types import FractionalMotive
 
 
 class Exp(MotivicSeries):
     def __init__(self, arg: MotivicSeries) -> None:
-        super().__init__(cone=arg.cone, name=f"Exp({arg.name})")
+        super().__init__(cone=arg.cone, name=lambda: f"Exp({arg.name})")
         self.arg = arg
         self._psi_cache: dict[DimensionVector, FractionalMotive] = {}
+        self._term_cache: dict[tuple[DimensionVector, int], FractionalMotive] = {}
         self._validate()
 
     def _validate(self) -> None:
@@ -21,12 +22,15 @@ class Exp(MotivicSeries):
     def _at(self, d: DimensionVector) -> FractionalMotive:
         if d.is_zero():
             return Integer(1)
-        return factor(
-            sum(
-                prod(self._psi(e) ** m * Rational(1, factorial(m)) for e, m in p.items())
-                for p in self.cone.partitions(d)
-            )
-        )
+        return factor(Add(*partition_products(self._term, self.cone.partitions(d))))
+
+    def _term(self, e: DimensionVector, m: int) -> FractionalMotive:
+        """returns psi(e)**m / m!, the factor contributed by a part e of multiplicity m"""
+        try:
+            return self._term_cache[(e, m)]
+        except KeyError:
+            self._term_cache[(e, m)] = self._psi(e) ** m * Rational(1, factorial(m))
+            return self._term_cache[(e, m)]
 
     def _psi(self, d: DimensionVector) -> FractionalMotive:
         try:
@@ -34,6 +38,6 @@ class Exp(MotivicSeries):
         except KeyError:
             n: int = d[0] if len(d) == 1 else gcd(*d)
             self._psi_cache[d] = factor(
-                sum(self.arg(d / k).subs(R, -((-R) ** k)) * Rational(1, k) for k in divisors(n))
+                sum(adams_operation(self.arg(d / k), k) * Rational(1, k) for k in divisors(n))
             )
             return self._psi_cache[d]
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from math import prod
 from typing import cast
 
+from sympy import Mul
+
 from ..linear_algebra.dimension_vector import DimensionVector
 from .symbols import L
 from .types import Motive
@@ -11,6 +14,12 @@ from .types import Motive
 class GL(Motive):
     def __new__(cls, d: int | DimensionVector) -> GL:
         if isinstance(d, int):
-            return prod(L**d - L**k for k in range(d))
+            return cast(GL, _gl(d))
         else:
-            return cast(GL, prod(GL(n) for n in d))
+            return cast(GL, prod(_gl(n) for n in d))
+
+
+@lru_cache(maxsize=None)
+def _gl(n: int) -> Motive:
+    """the motive of GL(n), which is needed for the same small n over and over"""
+    return Mul(*(L**n - L**k for k in range(n)))
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
+from functools import cached_property
 from typing import Callable, Optional
 
 from ..linear_algebra.dimension_vector import DimensionVector
-from .types import FractionalMotive
+from .types import FractionalMotive, Name
 
 
 class GradedMotive:
@@ -11,14 +12,20 @@ class GradedMotive:
         self,
         rank: int,
         at_dv: Optional[Callable[[DimensionVector], FractionalMotive]] = None,
-        name: Optional[str] = None,
+        name: Optional[Name] = None,
     ) -> None:
         assert rank > 0, "Rank must be positive!"
-        self.name: str = name if name else repr(self)
+        self._name = name
         self.rank = rank
         self.at_dv = at_dv
         self._cache: dict[DimensionVector, FractionalMotive] = {}
 
+    @cached_property
+    def name(self) -> str:
+        if callable(self._name):
+            return self._name()
+        return self._name if self._name else repr(self)
+
     def at(self, d: DimensionVector) -> FractionalMotive:
         assert len(d) == self.rank, f"DimensionVector must have length {self.rank}"
         if self.at_dv:
@@ -1,18 +1,19 @@
-from math import factorial, gcd, prod
+from math import factorial, gcd
 
-from sympy import Integer, Rational, divisors, factor
+from sympy import Add, Integer, Rational, factor
 
 from ..linear_algebra.dimension_vector import DimensionVector
+from .adams import adams_operation, divisors, partition_products
 from .motivic_series import MotivicSeries
-from .symbols import R
 from .types import FractionalMotive
 
 
 class Log(MotivicSeries):
     def __init__(self, arg: MotivicSeries) -> None:
-        super().__init__(cone=arg.cone, name=f"Log({arg.name})")
+        super().__init__(cone=arg.cone, name=lambda: f"Log({arg.name})")
         self.arg = arg
         self._psi_cache: dict[DimensionVector, FractionalMotive] = {}
+        self._term_cache: dict[tuple[DimensionVector, int], FractionalMotive] = {}
         self._validate()
 
     def _validate(self) -> None:
@@ -26,19 +27,23 @@ class Log(MotivicSeries):
         return factor(
             self.arg(d)
             - self._psi_red(d)
-            - sum(
-                prod((self._psi_red(e) + self(e)) ** m * Rational(1, factorial(m)) for e, m in p.items())
-                for p in self.cone.partitions(d)
-                if p != {d: 1}
-            )
+            - Add(*partition_products(self._term, (p for p in self.cone.partitions(d) if p[0] != (d,))))
         )
 
+    def _term(self, e: DimensionVector, m: int) -> FractionalMotive:
+        """returns (psi_red(e) + log(e))**m / m!, the factor contributed by a part e of multiplicity m"""
+        try:
+            return self._term_cache[(e, m)]
+        except KeyError:
+            self._term_cache[(e, m)] = (self._psi_red(e) + self(e)) ** m * Rational(1, factorial(m))
+            return self._term_cache[(e, m)]
+
     def _psi_red(self, d: DimensionVector) -> FractionalMotive:
         try:
             return self._psi_cache[d]
         except KeyError:
             n: int = d[0] if len(d) == 1 else gcd(*d)
             self._psi_cache[d] = factor(
-                sum(self(d / k).subs(R, -((-R) ** k)) * Rational(1, k) for k in divisors(n) if k != 1)
+                sum(adams_operation(self(d / k), k) * Rational(1, k) for k in divisors(n) if k != 1)
             )
             return self._psi_cache[d]
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-import math
+from operator import mul
 from typing import TYPE_CHECKING, cast
 
 import sympy
@@ -35,13 +35,18 @@ class MotiveOfSemistables(SlicedMotive):
             # we take the cone at phase + 1 and shift it back
             return self.cone_at(phi[1])[-1]
 
+        # phi covers the charge of d iff the linear form phi.real * imag(d) - phi.imag * real(d) vanishes at d
+        charge = self.stab_cond.charge
+        normal: tuple[int, ...] = tuple(phi.real * b - phi.imag * a for a, b in zip(charge.real, charge.imag))
+        contains, ambient_pred_of = self.cone_of_all_objects.contains, self.cone_of_all_objects.pred_of
+
         def is_contained(d: DimensionVector) -> bool:
-            return self.cone_of_all_objects.contains(d) and phi.covers(self.stab_cond.charge(d))
+            return contains(d) and not sum(map(mul, normal, d))
 
         def pred_of(d: DimensionVector, upper_bound: DimensionVector) -> DimensionVector:
-            e: DimensionVector = self.cone_of_all_objects.pred_of(d, upper_bound)
+            e: DimensionVector = ambient_pred_of(d, upper_bound)
             while not is_contained(e):
-                e = self.cone_of_all_objects.pred_of(e, upper_bound)
+                e = ambient_pred_of(e, upper_bound)
             return e
 
         return Cone(rank=self.rank, is_contained=is_contained, pred_of=pred_of)
@@ -50,9 +55,11 @@ class MotiveOfSemistables(SlicedMotive):
         return self.stab_cond.charge.phase(d)
 
     def _at(self, d: DimensionVector) -> FractionalMotive:
-        result: FractionalMotive = self.motive_of_all_objects(d) - sum(
-            L**exponent * math.prod(cast(FractionalMotive, self(e)) for e in part)
-            for part, exponent in self.stab_cond.hn_partitions(d)
-            if part != {d}
+        result: FractionalMotive = self.motive_of_all_objects(d) - sympy.Add(
+            *(
+                sympy.Mul(L**exponent, *(cast(FractionalMotive, self(e)) for e in part))
+                for part, exponent in self.stab_cond.hn_partitions(d)
+                if len(part) > 1  # the only HN partition with a single part is {d}
+            )
         )
         return sympy.factor(result)
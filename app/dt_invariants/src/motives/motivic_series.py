@@ -7,7 +7,7 @@ import sympy
 from ..linear_algebra.cone import Cone
 from ..linear_algebra.dimension_vector import DimensionVector
 from .graded_motive import GradedMotive
-from .types import FractionalMotive
+from .types import FractionalMotive, Name
 
 
 class MotivicSeries(GradedMotive):
@@ -15,9 +15,11 @@ class MotivicSeries(GradedMotive):
         self,
         cone: Cone,
         at_dv: Optional[Callable[[DimensionVector], FractionalMotive]] = None,
-        name: Optional[str] = None,
+        name: Optional[Name] = None,
+        at_dvs: Optional[Callable[[list[DimensionVector]], list[FractionalMotive]]] = None,
     ) -> None:
         self.cone = cone
+        self.at_dvs = at_dvs
         super().__init__(rank=cone.rank, at_dv=at_dv, name=name)
 
     def at(self, d: DimensionVector) -> FractionalMotive:
@@ -25,10 +27,21 @@ class MotivicSeries(GradedMotive):
             return sympy.Integer(0)
         return super().at(d)
 
+    def at_many(self, ds: list[DimensionVector]) -> list[FractionalMotive]:
+        """Evaluates the series at several dimension vectors. Coefficients missing from
+        the cache are computed in one call of 'at_dvs' if it has been provided.
+        """
+        for d in ds:
+            assert len(d) == self.rank, f"DimensionVector must have length {self.rank}"
+        if self.at_dvs:
+            missing = [d for d in dict.fromkeys(ds) if d not in self._cache and self.cone.contains(d)]
+            if missing:
+                self._cache.update(zip(missing, self.at_dvs(missing)))
+        return [self(d) for d in ds]
+
     def __getitem__(self, shift: int) -> MotivicSeries:
-        return MotivicSeries(
-            cone=self.cone[shift], at_dv=lambda d: self((-1) ** shift * d), name=f"{self.name}[{shift}]"
-        )
+        at_dv: Callable[[DimensionVector], FractionalMotive] = (lambda d: self(-d)) if shift % 2 else self
+        return MotivicSeries(cone=self.cone[shift], at_dv=at_dv, name=lambda: f"{self.name}[{shift}]")
 
     def below(self, d: DimensionVector, expand: bool = False, factorize: bool = False) -> FractionalMotive:
         assert not expand or not factorize, "you cannot factorize and expand at the same time"
@@ -42,4 +55,5 @@ class MotivicSeries(GradedMotive):
                 return m
 
         x = sympy.Symbol("x")
-        return sum(format(self(e)) * (x ** sympy.Symbol(str(e))) for e in self.cone.summands(d))
+        summands = list(self.cone.summands(d))
+        return sympy.Add(*(format(m) * (x ** sympy.Symbol(str(e))) for e, m in zip(summands, self.at_many(summands))))
@@ -5,7 +5,7 @@ from ..linear_algebra.dimension_vector import DimensionVector
 from ..linear_algebra.phase import Phase
 from .graded_motive import GradedMotive
 from .motivic_series import MotivicSeries
-from .types import FractionalMotive
+from .types import FractionalMotive, Name
 
 VectorOrPhase = Union[DimensionVector, Phase]
 MotiveOrSeries = Union[FractionalMotive, MotivicSeries]
@@ -15,26 +15,33 @@ class SlicedMotive(GradedMotive):
     def __init__(
         self,
         rank: int,
-        name: Optional[str] = None,
+        name: Optional[Name] = None,
         cone_at: Optional[Callable[[Phase], Cone]] = None,
         phase_of: Optional[Callable[[DimensionVector], Phase]] = None,
     ) -> None:
         self._cone_at = cone_at
         self._phase_of = phase_of
         super().__init__(rank=rank, name=name)
-        self._cache: dict[VectorOrPhase, MotiveOrSeries] = {}  # type: ignore[assignment]
+        # dimension vectors use the cache inherited from GradedMotive, phases get their own, so that a lookup never
+        # compares keys of both types
+        self._phase_cache: dict[Phase, MotivicSeries] = {}
 
     def __call__(self, arg: VectorOrPhase) -> MotiveOrSeries:  # type: ignore[override]
-        try:
-            return self._cache[arg]
-        except KeyError:
-            if isinstance(arg, DimensionVector):
+        # the caches are owned by this method, 'at' and 'of' only compute
+        if isinstance(arg, DimensionVector):
+            try:
+                return self._cache[arg]
+            except KeyError:
                 self._cache[arg] = self.at(arg)
-            elif isinstance(arg, Phase):
-                self._cache[arg] = self.of(arg)
-            else:
-                raise ValueError("arg must be a dimension vector or a phase")
-            return self._cache[arg]
+                return self._cache[arg]
+        elif isinstance(arg, Phase):
+            try:
+                return self._phase_cache[arg]
+            except KeyError:
+                self._phase_cache[arg] = self.of(arg)
+                return self._phase_cache[arg]
+        else:
+            raise ValueError("arg must be a dimension vector or a phase")
 
     def of(self, phi: Phase) -> MotivicSeries:
         try:
@@ -42,10 +49,9 @@ class SlicedMotive(GradedMotive):
         except NotImplementedError:
             result = MotivicSeries(
                 cone=cast(Callable[[Phase], Cone], self._cone_at)(phi),
-                at_dv=lambda d: self.at(d),
-                name=f"{self.name}({float(phi)})",
+                at_dv=lambda d: cast(FractionalMotive, self(d)),
+                name=lambda: f"{self.name}({float(phi)})",
             )
-        self._cache[phi] = result
         return result
 
     def at(self, d: DimensionVector) -> FractionalMotive:
@@ -54,7 +60,6 @@ class SlicedMotive(GradedMotive):
         except NotImplementedError:
             phi: Phase = cast(Callable[[DimensionVector], Phase], self._phase_of)(d)
             result = cast(MotivicSeries, self(phi))(d)
-        self._cache[d] = result
         return result
 
     def _of(self, phi: Phase) -> MotivicSeries:
@@ -2,5 +2,5 @@ from sympy import Rational, Symbol
 
 from .types import Motive
 
-L: Motive = Symbol("\U0001D543")
+L: Motive = Symbol("\U0001D543", positive=True)
 R: Motive = L ** Rational(1, 2)
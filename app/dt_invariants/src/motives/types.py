@@ -1,4 +1,8 @@
+from typing import Callable, Union
+
 from sympy.core.expr import Expr
 
 FractionalMotive = Expr
 Motive = Expr
+# a name, or a callable building the name when it is first read
+Name = Union[str, Callable[[], str]]
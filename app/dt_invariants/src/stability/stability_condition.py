@@ -1,4 +1,5 @@
-from typing import Generator, Optional, cast
+from functools import cached_property
+from typing import Generator, Optional
 
 from ..categories.abelian_category import AbelianCategory
 from ..categories.slicing import Slicing
@@ -6,6 +7,7 @@ from ..linear_algebra.central_charge import CentralCharge
 from ..linear_algebra.cone import Cone
 from ..linear_algebra.dimension_vector import DimensionVector
 from ..linear_algebra.pairing import Pairing
+from ..linear_algebra.phase import Phase
 from ..motives.motive_of_semistables import MotiveOfSemistables
 from ..motives.motivic_series import MotivicSeries
 
@@ -19,7 +21,6 @@ class StabilityCondition:
         self.pairing: Pairing = abelian_category.euler_pairing
         self.motive_of_all_objects: MotivicSeries = abelian_category.motive_of_objects
         self.cone: Cone = self.motive_of_all_objects.cone
-        self._semistables: Optional[Slicing] = None
 
         assert self.charge.rank == self.rank, "abelian_category and central charge must have the same rank"
 
@@ -39,39 +40,48 @@ class StabilityCondition:
             k = 2 * d
         if k.is_zero():
             return
-        e: DimensionVector = self.cone.pred_of(k, d)
-        if e.is_zero():
-            return
-        r: DimensionVector = d - e
-        i: int = 0
-        while i < 10_000:
-            if r.is_zero():
-                yield {e}, 0
-            else:
-                for part, exponent in self.hn_partitions(r, e):
-                    if not any(self.collinear(e, p) for p in part):
-                        exponent -= sum(
-                            self.pairing(p, e) if self.charge.phase(e) < self.charge.phase(p) else self.pairing(e, p)
-                            for p in part
-                        )
-                        part.add(e)
-                        yield part, exponent
-            e = self.cone.pred_of(e, d)
-            r = d - e
+        pred_of, phase, pairing = self.cone.pred_of, self.charge.phase, self.pairing
+        # The parts split off so far, together with their phases, the vectors they were split off from and the
+        # exponents accumulated by them. A candidate e is split off from 'rest', which is d minus all parts so far.
+        parts: list[DimensionVector] = []
+        phases: list[Phase] = []
+        rests: list[DimensionVector] = []
+        exponents: list[int] = [0]
+        rest: DimensionVector = d
+        e: DimensionVector = pred_of(k, d)
+        while True:
             if e.is_zero():
-                return
-            i += 1
+                # all candidates of this level are exhausted, continue with the next candidate one level up
+                if not parts:
+                    return
+                rest = rests.pop()
+                e = pred_of(parts.pop(), rest)
+                phases.pop()
+                exponents.pop()
+                continue
+            phase_of_e = phase(e)
+            exponent = exponents[-1]
+            for p, phase_of_p in zip(parts, phases):
+                # parts of a HN partition have pairwise different phases
+                if phase_of_p == phase_of_e:
+                    break
+                exponent -= pairing(e, p) if phase_of_p < phase_of_e else pairing(p, e)
+            else:
+                r: DimensionVector = rest - e
+                if r.is_zero():
+                    yield {*parts, e}, exponent
+                else:
+                    parts.append(e)
+                    phases.append(phase_of_e)
+                    rests.append(rest)
+                    exponents.append(exponent)
+                    rest, e = r, pred_of(e, r)
+                    continue
+            e = pred_of(e, rest)
 
-    @property
+    @cached_property
     def semistables(self) -> Slicing:
-        if self._semistables:
-            return self._semistables
-        else:
-            self.set_semistables()
-            return cast(Slicing, self._semistables)
-
-    def set_semistables(self) -> None:
-        self._semistables = Slicing(
+        return Slicing(
             motive_of_objects=MotiveOfSemistables(self),
             euler_pairing=self.abelian_category.euler_pairing,
             name=f"{self.abelian_category.name}_ss",
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# the package lives in 'app' (see 'package_dir' in setup.py), make it importable without installing it
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app"))
@@ -0,0 +1,27 @@
+from itertools import product
+
+from dt_invariants import CentralCharge, DimensionVector, Phase
+
+
+def test_values_and_phases():
+    charge = CentralCharge(real=[1, 0, -2], imag=[1, 2, 1])
+    for coords in product(range(3), repeat=3):
+        d = DimensionVector(coords)
+        if d.is_zero():
+            continue
+        real, imag = sum(a * x for a, x in zip([1, 0, -2], coords)), sum(b * x for b, x in zip([1, 2, 1], coords))
+        assert charge(d) == (real, imag)
+        assert charge.phase(d) == Phase(real=real, imag=imag, branch=0 if imag > 0 or imag == 0 and real < 0 else 1)
+
+
+def test_caches_are_bounded(monkeypatch):
+    from dt_invariants.src.linear_algebra import central_charge as central_charge_module
+
+    monkeypatch.setattr(central_charge_module, "MAX_CACHED_VECTORS", 2)
+    charge = CentralCharge(real=[1, -1])
+    a, b, c = DimensionVector(1, 0), DimensionVector(0, 1), DimensionVector(1, 1)
+    for d in (a, b, a, c):
+        charge.phase(d)
+    assert len(charge._cache) == 2
+    assert list(charge._phase_cache) == [a, c]
+    assert charge(b) == (-1, 1)
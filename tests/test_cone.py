@@ -0,0 +1,148 @@
+from itertools import product
+
+import pytest
+
+from dt_invariants import DimensionVector, StandardCone, standard_cone
+
+
+def reference_pred_of(d, upper_bound):
+    """the predecessor in the standard cone as originally implemented"""
+    predecessor = list(d)
+    for idx, x in enumerate(d):
+        if upper_bound[idx] < x:
+            predecessor[idx:] = upper_bound[idx:]
+            return DimensionVector(predecessor)
+    idx = -1
+    while True:
+        if d[idx] > 0:
+            predecessor[idx] -= 1
+            return DimensionVector(predecessor)
+        predecessor[idx] = upper_bound[idx]
+        idx -= 1
+
+
+def reference_summands(d):
+    e = d
+    yield e
+    while not e.is_zero():
+        e = reference_pred_of(e, d)
+        yield e
+
+
+def reference_partitions(d, below=None):
+    """the recursive enumeration of partitions as originally implemented, as lists of (part, multiplicity)"""
+    if below is None:
+        below = 2 * d
+    if below.is_zero():
+        return
+    e = reference_pred_of(below, d)
+    if e.is_zero():
+        return
+    q, r = divmod(d, e)
+    while True:
+        if r.is_zero():
+            yield [(e, q)]
+        else:
+            for partition in reference_partitions(r, below=e):
+                yield [(e, q), *partition]
+        if q > 1:
+            q, r = q - 1, r + e
+        else:
+            e = reference_pred_of(e, d)
+            if e.is_zero():
+                return
+            q, r = divmod(d, e)
+
+
+def small_vectors(rank, bound):
+    return [DimensionVector(coords) for coords in product(range(bound + 1), repeat=rank) if any(coords)]
+
+
+def count_partitions(d):
+    """the number of partitions of d into nonzero vectors of the standard cone, read off from the generating
+    function prod_e 1 / (1 - x^e) by multiplying in one factor after the other"""
+    vectors = sorted(product(*(range(x + 1) for x in d)))
+    counts = dict.fromkeys(vectors, 0)
+    counts[vectors[0]] = 1
+    for e in vectors[1:]:
+        for v in vectors:
+            if all(a >= b for a, b in zip(v, e)):
+                counts[v] += counts[tuple(a - b for a, b in zip(v, e))]
+    return counts[tuple(d)]
+
+
+@pytest.mark.parametrize("rank, bound", [(1, 6), (2, 3), (3, 2)])
+def test_summands_in_descending_order(rank, bound):
+    cone = StandardCone(rank=rank)
+    for d in small_vectors(rank, bound):
+        assert list(cone.summands(d)) == list(reference_summands(d)), d
+
+
+@pytest.mark.parametrize("rank, bound", [(1, 6), (2, 3), (3, 2)])
+def test_partitions(rank, bound):
+    cone = StandardCone(rank=rank)
+    for d in small_vectors(rank, bound):
+        expected = list(reference_partitions(d))
+        assert [list(zip(parts, mults)) for parts, mults in cone.partitions(d)] == expected, d
+        # a second call is served from the cache
+        assert [list(zip(parts, mults)) for parts, mults in cone.partitions(d)] == expected, d
+
+
+def test_partitions_of_negated_cone():
+    cone = StandardCone(rank=2)[1]
+    for d in small_vectors(2, 3):
+        expected = [[(-e, m) for e, m in partition] for partition in reference_partitions(d)]
+        assert [list(zip(parts, mults)) for parts, mults in cone.partitions(-d)] == expected, d
+
+
+def test_partitions_example():
+    cone = StandardCone(rank=1)
+    assert list(cone.partitions_as_dict(DimensionVector(3))) == [
+        {DimensionVector(3): 1},
+        {DimensionVector(2): 1, DimensionVector(1): 1},
+        {DimensionVector(1): 3},
+    ]
+
+
+
+@pytest.mark.parametrize("d", [(33,), (9, 9)])
+def test_partitions_are_not_truncated(d):
+    # both have more than 10_000 partitions
+    cone = StandardCone(rank=len(d))
+    assert sum(1 for _ in cone.partitions(DimensionVector(d))) == count_partitions(d) > 10_000
+
+
+def test_long_enumerations_are_streamed_not_cached(monkeypatch):
+    from dt_invariants.src.linear_algebra import cone as cone_module
+
+    monkeypatch.setattr(cone_module, "MAX_CACHED_ENUMERATION", 5)
+    cone = StandardCone(rank=2)
+    d = DimensionVector(3, 3)
+    summands = list(cone.summands(d))
+    assert len(summands) == 16 and summands == list(cone.summands(d))
+    assert d not in cone._summands_cache
+    assert list(cone.summands(DimensionVector(1, 1))) == list(map(DimensionVector, [(1, 1), (1, 0), (0, 1), (0, 0)]))
+    assert DimensionVector(1, 1) in cone._summands_cache
+
+
+def test_least_recently_used_enumerations_are_dropped(monkeypatch):
+    from dt_invariants.src.linear_algebra import cone as cone_module
+
+    monkeypatch.setattr(cone_module, "MAX_CACHED_VECTORS", 2)
+    cone = StandardCone(rank=1)
+    a, b, c = DimensionVector(1), DimensionVector(2), DimensionVector(3)
+    for d in (a, b, a, c):
+        partitions = list(cone.partitions(d))
+    assert partitions == list(cone.partitions(c))
+    assert list(cone._partitions_cache) == [a, c]
+
+
+def test_partitions_batch():
+    cone = StandardCone(rank=2)
+    ds = [DimensionVector(2, 1), DimensionVector(0, 3), DimensionVector(2, 1), DimensionVector(1, 1)]
+    assert cone.partitions_batch(ds) == [list(cone.partitions(d)) for d in ds]
+
+
+def test_standard_cones_are_shared_but_not_kept_forever():
+    assert standard_cone(2) is standard_cone(2)
+    assert standard_cone.cache_info().maxsize is not None
@@ -0,0 +1,73 @@
+import pytest
+from sympy import cancel, sympify
+
+from dt_invariants import CentralCharge, DimensionVector, L, Quiver, StabilityCondition
+
+QUIVERS = {
+    "conifold": (2, {(0, 1): 2, (1, 0): 2, (0, 0): 1, (1, 1): 1}, [0, 1]),
+    "kronecker": (2, {(0, 1): 3}, [1, -1]),
+    "cyclic": (3, {(0, 1): 1, (1, 2): 1, (2, 0): 1}, [1, 0, -1]),
+    "a3": (3, {(0, 1): 1, (1, 2): 1}, [2, 1, 0]),
+}
+
+# values computed with the original implementation, 'L' stands for the Lefschetz motive
+EXPECTED = [
+    ("conifold", (1, 1), "(L**5 + L**4)/L**(5/2)"),
+    ("conifold", (1, 2), "(L**9 + L**8 + L**7)/L**(9/2)"),
+    (
+        "conifold",
+        (2, 3),
+        "(L**25 + L**24 + 3*L**23 + 4*L**22 + 6*L**21 + 7*L**20 + 7*L**19 + 4*L**18 + 2*L**17)/L**(25/2)",
+    ),
+    ("kronecker", (1, 1), "(L**2 + L + 1)/L"),
+    ("kronecker", (2, 2), "(L**5 + L**4 + L**3 + L**2 + L + 1)/L**(5/2)"),
+    ("kronecker", (1, 2), "(L**2 + L + 1)/L"),
+    ("kronecker", (2, 3), "(L**6 + L**5 + 3*L**4 + 3*L**3 + 3*L**2 + L + 1)/L**3"),
+    ("kronecker", (3, 3), "(L**10 + L**9 + 2*L**8 + 2*L**7 + 2*L**6 + 2*L**5 + 2*L**4 + 2*L**3 + 2*L**2 + L + 1)/L**5"),
+    # the phases of these rank 3 dimension vectors have hashed like the vectors themselves
+    ("cyclic", (1, 1, 1), "sqrt(L)"),
+    ("cyclic", (2, 1, 1), "0"),
+    ("cyclic", (0, 1, 1), "1"),
+    ("cyclic", (1, 0, 1), "0"),
+    ("cyclic", (1, 1, 0), "1"),
+    ("cyclic", (2, 2, 1), "0"),
+    ("cyclic", (2, 2, 2), "0"),
+    ("a3", (1, 1, 1), "1"),
+    ("a3", (1, 1, 0), "1"),
+    ("a3", (0, 1, 1), "1"),
+    ("a3", (2, 1, 1), "0"),
+    ("a3", (1, 2, 1), "0"),
+]
+
+
+@pytest.fixture(scope="module")
+def dt_invariants():
+    result = {}
+    for name, (num_vertices, arrow_matrix, real) in QUIVERS.items():
+        quiver = Quiver(num_vertices=num_vertices, arrow_matrix=arrow_matrix)
+        stab_cond = StabilityCondition(abelian_category=quiver.reps, charge=CentralCharge(real=real))
+        result[name] = stab_cond.semistables.dt_invariants
+    return result
+
+
+@pytest.mark.parametrize("name, d, expected", EXPECTED)
+def test_dt_invariants(dt_invariants, name, d, expected):
+    value = dt_invariants[name](DimensionVector(d))
+    assert cancel(value - sympify(expected, locals={"L": L})) == 0
+
+
+def test_names_of_slices_are_built_lazily(monkeypatch):
+    from dt_invariants import Phase
+
+    def no_float(phi):
+        raise AssertionError("phase converted to float")
+
+    quiver = Quiver(num_vertices=2, arrow_matrix={(0, 1): 3})
+    stab_cond = StabilityCondition(abelian_category=quiver.reps, charge=CentralCharge(real=[1, -1]))
+    dt_invariants = stab_cond.semistables.dt_invariants
+    with monkeypatch.context() as patch:
+        patch.setattr(Phase, "__float__", no_float)
+        value = dt_invariants(DimensionVector(1, 1))
+    assert cancel(value - sympify("(L**2 + L + 1)/L", locals={"L": L})) == 0
+    phi = stab_cond.charge.phase(DimensionVector(1, 1))
+    assert str(float(phi)) in dt_invariants.slicing(phi).name
@@ -0,0 +1,24 @@
+import pytest
+
+from dt_invariants import DimensionVector, L, MotivicSeries, StandardCone
+
+
+def make_series():
+    return MotivicSeries(
+        cone=StandardCone(rank=2),
+        at_dv=lambda d: L ** d[0] * (1 + L) ** d[1],
+        at_dvs=lambda ds: [L ** d[0] * (1 + L) ** d[1] for d in ds],
+    )
+
+
+def test_at_many():
+    ds = [DimensionVector(1, 2), DimensionVector(0, 0), DimensionVector(-1, 1), DimensionVector(1, 2)]
+    expected = [make_series()(d) for d in ds]
+    series = make_series()
+    assert series.at_many(ds) == expected
+    assert series.at_many(ds) == [series(d) for d in ds]
+
+
+def test_at_many_checks_the_rank():
+    with pytest.raises(AssertionError):
+        make_series().at_many([DimensionVector(1, 2), DimensionVector(1, 2, 3)])
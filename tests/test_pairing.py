@@ -0,0 +1,16 @@
+from itertools import product
+
+from dt_invariants import DimensionVector, Pairing
+
+PAIRING = Pairing(rank=3, coeff_matrix={(0, 0): 1, (0, 1): -2, (1, 2): 3, (2, 0): -1, (2, 2): 1})
+VECTORS = [DimensionVector(coords) for coords in product(range(-1, 2), repeat=3)]
+
+
+def test_batch():
+    ds, es = VECTORS[:10], VECTORS[5:]
+    assert PAIRING.batch(ds, es) == [[PAIRING(d, e) for e in es] for d in ds]
+
+
+def test_gram():
+    assert PAIRING.gram(VECTORS) == [[PAIRING(v, w) for w in VECTORS] for v in VECTORS]
+
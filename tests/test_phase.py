@@ -0,0 +1,59 @@
+from cmath import phase as argument
+from itertools import product
+from math import pi
+
+import pytest
+
+from dt_invariants import DimensionVector, Phase
+
+
+def all_phases():
+    phases = []
+    for real, imag, branch in product(range(-4, 5), range(-4, 5), range(-2, 4)):
+        if branch % 2 == 0 and (imag > 0 or real < 0) or branch % 2 == 1 and (imag < 0 or real > 0):
+            phases.append(Phase(real=real, imag=imag, branch=branch))
+    return phases
+
+
+def reference_float(phi):
+    return phi.branch + argument((-1) ** phi.branch * complex(phi.real, phi.imag)) / pi
+
+
+def reference_less(phi, psi):
+    def slope(p):
+        return -p.real / p.imag if p.imag else float("inf")
+
+    return (phi.branch, slope(phi)) < (psi.branch, slope(psi))
+
+
+PHASES = all_phases()
+
+
+def test_float():
+    for phi in PHASES:
+        assert float(phi) == pytest.approx(reference_float(phi)), phi
+
+
+def test_ordering():
+    for phi, psi in product(PHASES, repeat=2):
+        assert (phi < psi) == reference_less(phi, psi), (phi, psi)
+
+
+def test_hash_is_consistent_with_equality():
+    for phi, psi in product(PHASES, repeat=2):
+        if phi == psi:
+            assert hash(phi) == hash(psi), (phi, psi)
+
+
+def test_positive_multiples_are_equal():
+    assert Phase(real=2, imag=4, branch=0) == Phase(real=1, imag=2, branch=0)
+    assert Phase(real=2, imag=4, branch=0) != Phase(real=2, imag=4, branch=2)
+
+
+def test_phase_differs_from_tuple_with_same_entries():
+    phase = Phase(real=1, imag=1, branch=0)
+    d = DimensionVector(0, 1, 1)
+    assert hash(phase) != hash(d)
+    assert phase != d
+    assert d != phase
+    assert len({phase: 0, d: 1}) == 2
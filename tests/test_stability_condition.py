@@ -0,0 +1,49 @@
+from itertools import product
+
+import pytest
+
+from dt_invariants import CentralCharge, DimensionVector, Quiver, StabilityCondition
+
+
+def reference_hn_partitions(stab_cond, d, k=None):
+    """the recursive enumeration of HN partitions as originally implemented"""
+    cone, charge, pairing = stab_cond.cone, stab_cond.charge, stab_cond.pairing
+    if k is None:
+        k = 2 * d
+    if k.is_zero():
+        return
+    e = cone.pred_of(k, d)
+    while not e.is_zero():
+        r = d - e
+        if r.is_zero():
+            yield {e}, 0
+        else:
+            for part, exponent in reference_hn_partitions(stab_cond, r, e):
+                if not any(charge.phase(e) == charge.phase(p) for p in part):
+                    exponent -= sum(
+                        pairing(p, e) if charge.phase(e) < charge.phase(p) else pairing(e, p) for p in part
+                    )
+                    yield part | {e}, exponent
+        e = cone.pred_of(e, d)
+
+
+STABILITY_CONDITIONS = [
+    (2, {(0, 1): 3}, [1, -1]),
+    (2, {(0, 1): 2, (1, 0): 2, (0, 0): 1, (1, 1): 1}, [0, 1]),
+    (2, {(0, 1): 1}, [0, 0]),
+    (3, {(0, 1): 1, (1, 2): 1, (2, 0): 1}, [1, 0, -1]),
+    (3, {(0, 1): 1, (1, 2): 1}, [2, 1, 0]),
+    (3, {(0, 1): 2, (2, 1): 1}, [-1, 2, 0]),
+]
+
+
+@pytest.mark.parametrize("num_vertices, arrow_matrix, real", STABILITY_CONDITIONS)
+def test_hn_partitions(num_vertices, arrow_matrix, real):
+    quiver = Quiver(num_vertices=num_vertices, arrow_matrix=arrow_matrix)
+    stab_cond = StabilityCondition(abelian_category=quiver.reps, charge=CentralCharge(real=real))
+    bound = 3 if num_vertices == 2 else 2
+    for coords in product(range(bound + 1), repeat=num_vertices):
+        d = DimensionVector(coords)
+        if d.is_zero():
+            continue
+        assert list(stab_cond.hn_partitions(d)) == list(reference_hn_partitions(stab_cond, d)), d